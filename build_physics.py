@@ -0,0 +1,76 @@
+# build_physics.py
+"""
+Ahead-of-time build of the per-tick physics kernels.
+
+Run once (python build_physics.py) to produce the flight_physics_compiled
+extension next to this file. flight_physics picks it up automatically and
+then skips JIT compilation at start-up; without it the Numba JIT is used.
+The build records a fingerprint of flight_physics.py, and a build that no
+longer matches the source is ignored with a warning.
+"""
+
+import os
+
+from numba.pycc import CC
+
+# build from the jitted kernels, never from a previous AOT build
+os.environ["FLARE_DISABLE_AOT"] = "1"
+import flight_physics as fp
+
+cc = CC("flight_physics_compiled")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+SOURCE_FINGERPRINT = fp._source_fingerprint()
+
+
+@cc.export("source_fingerprint", "i8()")
+def source_fingerprint():
+    return SOURCE_FINGERPRINT
+
+
+FRAME_SIG = "Tuple((f8, f8, f8, f8, f8, f8, f8, f8, i8, i8, i8, b1, i8, f8))(f8, f8, f8, f8, f8, f8, f8, f8)"
+
+
+@cc.export("takeoff_core", "Tuple((i8, f8, f8, f8))(f8, f8, f8, f8)")
+def takeoff_core(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg):
+    return fp._takeoff_core(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg)
+
+
+@cc.export("landing_core", "Tuple((i8, f8))(f8, f8, f8, f8, f8)")
+def landing_core(velocity_mps, altitude_m, thrust_newtons, angle_of_attack_deg, flap_angle_deg):
+    return fp._landing_core(velocity_mps, altitude_m, thrust_newtons, angle_of_attack_deg, flap_angle_deg)
+
+
+@cc.export("stall_core", "Tuple((b1, f8, f8, f8))(f8, f8, f8, f8)")
+def stall_core(velocity_mps, angle_of_attack_deg, bank_angle_deg, flap_angle_deg):
+    return fp._stall_core(velocity_mps, angle_of_attack_deg, bank_angle_deg, flap_angle_deg)
+
+
+@cc.export("inflight_core", "Tuple((i8, f8, f8))(f8, f8, f8, f8, f8)")
+def inflight_core(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg, target_altitude_m):
+    return fp._inflight_core(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg, target_altitude_m)
+
+
+@cc.export("turn_core", "Tuple((f8, f8))(f8, f8)")
+def turn_core(velocity_mps, bank_angle_deg):
+    return fp._turn_core(velocity_mps, bank_angle_deg)
+
+
+@cc.export("altitude_hold_core", "Tuple((i8, f8, f8))(f8, f8, f8)")
+def altitude_hold_core(altitude_m, target_altitude_m, proportional_gain):
+    return fp._altitude_hold_core(altitude_m, target_altitude_m, proportional_gain)
+
+
+@cc.export("flight_frame", FRAME_SIG)
+def flight_frame(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg,
+                 bank_angle_deg, thrust_newtons, target_altitude_m, proportional_gain):
+    f = fp._flight_frame_kernel(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg,
+                                bank_angle_deg, thrust_newtons, target_altitude_m, proportional_gain)
+    return (f.lift_coefficient, f.lift_newtons, f.drag_coefficient, f.drag_newtons, f.weight_newtons,
+            f.stall_speed_in_turn_mps, f.load_factor, f.turn_radius_m,
+            f.takeoff_status, f.landing_status, f.inflight_mode, f.stall,
+            f.altitude_hold_command, f.commanded_climb_rate_mps)
+
+
+if __name__ == "__main__":
+    cc.compile()
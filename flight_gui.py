@@ -1,195 +1,377 @@
 # flight_gui.py
+"""
+Flight computer GUI.
+
+Run with: python flight_gui.py [--theme dark|classic]
+"""
+import argparse
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
-import random
 import math
 import time
+from dataclasses import dataclass, field
 
+import numpy as np
+
+from flight_history import HistoryBuffer
 from flight_physics import (
-    takeoff_algorithm,
-    landing_algorithm,
-    stall_algorithm,
-    inflight_algorithm,
-    turn_algorithm,
-    altitude_hold_algorithm,
-    calculate_lift_coefficient,
-    calculate_lift,
-    calculate_drag_coefficient,
-    calculate_drag,
+    compute_flight_frame,
+    TAKEOFF_STATUS,
+    LANDING_STATUS,
+    INFLIGHT_MODES,
+    ALTITUDE_HOLD_COMMANDS,
 )
 
 # ---------------- GUI COLORS ----------------
-BG = "#0f0f0f"
-CARD = "#1a1a1a"
-FG = "#e5e5e5"
-ACCENT = "#3ba55d"
-WARNING = "#d9534f"
+THEMES = {
+    "dark": {
+        "ttk_theme": "clam",
+        "bg": "#0f0f0f",
+        "card": "#1a1a1a",
+        "fg": "#e5e5e5",
+        "accent": "#3ba55d",
+        "warning": "#d9534f",
+        "caution": "yellow",
+        "panel_bg": "#0a0a0a",
+        "panel_fg": "#7fffb2",
+    },
+    "classic": {
+        "ttk_theme": "default",
+        "bg": "#f0f0f0",
+        "card": "#ffffff",
+        "fg": "#1a1a1a",
+        "accent": "#2e7d32",
+        "warning": "#c62828",
+        "caution": "#b8860b",
+        "panel_bg": "#ffffff",
+        "panel_fg": "#1a1a1a",
+    },
+}
 
 # ---------------- INITIAL STATE ----------------
-state = {
-    "velocity_mps": 70.0,
-    "altitude_m": 500.0,
-    "angle_of_attack_deg": 2.0,
-    "flap_angle_deg": 0.0,
-    "bank_angle_deg": 0.0,
-    "thrust_newtons": 10000.0,
-    "target_altitude_m": 2000.0,
-    "time_seconds": 0.0,
-}
+@dataclass(slots=True)
+class FlightState:
+    """Simulated aircraft state advanced once per tick (all floats, so the jitted kernel sees one signature)."""
+    velocity_mps: float = 70.0
+    altitude_m: float = 500.0
+    angle_of_attack_deg: float = 2.0
+    flap_angle_deg: float = 0.0
+    bank_angle_deg: float = 0.0
+    thrust_newtons: float = 10000.0
+    target_altitude_m: float = 2000.0
+    time_seconds: float = 0.0
+
+
+state = FlightState()
+
+# per-tick log of the simulated state and computed forces (float32 ring buffers, see flight_history)
+history = HistoryBuffer(("velocity_mps", "altitude_m", "angle_of_attack_deg",
+                         "bank_angle_deg", "thrust_newtons", "lift_newtons", "drag_newtons"))
+
+UPDATE_INTERVAL_MS = 1000   # physics tick, kept in phase against time.monotonic()
+POLL_INTERVAL_MS = 50       # how often Tk drains finished frames from the worker
+
+# uniform noise half-widths for velocity (m/s), altitude (m), angle of attack (deg)
+NOISE_AMPLITUDES = np.array([4.0, 8.0, 1.0])
+NOISE_BLOCK_TICKS = 1024
+
+
+def noise_stream(rng, amplitudes, block_ticks=NOISE_BLOCK_TICKS):
+    """Yield one row of uniform noise per tick, drawing from rng a whole block at a time."""
+    while True:
+        yield from rng.uniform(-amplitudes, amplitudes, size=(block_ticks, len(amplitudes))).tolist()
+
+
+noise = noise_stream(np.random.default_rng(), NOISE_AMPLITUDES)
+
+
+class CachedLabel(tk.Label):
+    """tk.Label whose set() skips the Tk config round-trip when nothing would change."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_text = kwargs.get("text")
+        self._last_fg = kwargs.get("fg")
+
+    def set(self, text, fg=None):
+        if fg is None:
+            fg = self._last_fg
+        if text == self._last_text and fg == self._last_fg:
+            return
+        self._last_text = text
+        self._last_fg = fg
+        self.config(text=text, fg=fg)
+
+
+STATUS_FIELDS = (
+    ("velocity", "Velocity:"),
+    ("altitude", "Altitude:"),
+    ("aoa", "AoA:"),
+    ("bank", "Bank:"),
+    ("flaps", "Flaps:"),
+    ("thrust", "Thrust:"),
+    ("lift", "Lift:"),
+    ("drag", "Drag:"),
+    ("cl", "Lift Coef:"),
+    ("cd", "Drag Coef:"),
+    ("takeoff", "TAKEOFF →"),
+    ("landing", "LANDING →"),
+    ("stall", "STALL →"),
+    ("inflight", "IN-FLIGHT →"),
+    ("turn", "TURN →"),
+    ("alt_hold", "ALT HOLD →"),
+)
+
+# categorical status text, prebuilt once and indexed by the kernel's status codes
+STALL_TEXT = ("False", "True")
+ALT_HOLD_PREFIX = tuple(f"{command}   Climb Rate: " for command in ALTITUDE_HOLD_COMMANDS)
+
+
+@dataclass
+class Display:
+    """Widgets the update loop writes to, plus the palette they were built with."""
+    palette: dict
+    warning: CachedLabel
+    speed: CachedLabel
+    altitude: CachedLabel
+    thrust: CachedLabel
+    status_vars: dict
+    start_btn: ttk.Button
+    stop_btn: ttk.Button
+    prev_display: dict = field(default_factory=dict)
 
-UPDATE_INTERVAL_MS = 1000
-running = False
 
 # ---------------- GUI SETUP ----------------
-root = tk.Tk()
-root.title("Flight Computer")
-root.geometry("800x650")
-root.configure(bg=BG)
-
-style = ttk.Style()
-style.theme_use("clam")
-style.configure("Card.TLabelframe", background=CARD, foreground=FG, borderwidth=0)
-style.configure("Card.TLabelframe.Label", background=CARD, foreground=FG, font=("Segoe UI", 11, "bold"))
-
-# ---------------- TITLE ----------------
-title = tk.Label(root, text="FLIGHT COMPUTER", font=("Segoe UI", 22, "bold"), bg=BG, fg=FG)
-title.pack(pady=10)
-
-# ---------------- WARNING PANEL ----------------
-warning_frame = ttk.LabelFrame(root, text="Warnings", style="Card.TLabelframe")
-warning_frame.pack(pady=8)
-
-warning_display = tk.Label(
-    warning_frame, text="No Active Warnings", bg=CARD, fg=WARNING,
-    font=("Segoe UI", 11), width=55, height=2
-)
-warning_display.pack(padx=10, pady=10)
+def build_ui(root, palette):
+    """Build the whole widget tree on root using the given THEMES palette."""
+    bg = palette["bg"]
+    card = palette["card"]
+    fg = palette["fg"]
+    panel_bg = palette["panel_bg"]
+    panel_fg = palette["panel_fg"]
+
+    root.title("Flight Computer")
+    root.geometry("800x760")
+    root.configure(bg=bg)
+
+    style = ttk.Style()
+    style.theme_use(palette["ttk_theme"])
+    style.configure("Card.TLabelframe", background=card, foreground=fg, borderwidth=0)
+    style.configure("Card.TLabelframe.Label", background=card, foreground=fg, font=("Segoe UI", 11, "bold"))
+
+    # ---------------- TITLE ----------------
+    title = tk.Label(root, text="FLIGHT COMPUTER", font=("Segoe UI", 22, "bold"), bg=bg, fg=fg)
+    title.pack(pady=10)
+
+    # ---------------- WARNING PANEL ----------------
+    warning_frame = ttk.LabelFrame(root, text="Warnings", style="Card.TLabelframe")
+    warning_frame.pack(pady=8)
+
+    warning_display = CachedLabel(
+        warning_frame, text="No Active Warnings", bg=card, fg=palette["warning"],
+        font=("Segoe UI", 11), width=55, height=2
+    )
+    warning_display.pack(padx=10, pady=10)
 
-# ---------------- STATUS BOX ----------------
-status_frame = ttk.LabelFrame(root, text="Flight Status (All 6 Algorithms)", style="Card.TLabelframe")
-status_frame.pack(pady=10)
+    # ---------------- STATUS BOX ----------------
+    status_frame = ttk.LabelFrame(root, text="Flight Status (All 6 Algorithms)", style="Card.TLabelframe")
+    status_frame.pack(pady=10)
 
-status_display = tk.Text(
-    status_frame, width=70, height=12, bg="#0a0a0a",
-    fg="#7fffb2", font=("Consolas", 12), relief="flat"
-)
-status_display.pack(padx=8, pady=8)
+    status_display = tk.Frame(status_frame, bg=panel_bg)
+    status_display.pack(padx=8, pady=8)
 
-# ---------------- METERS ----------------
-meter_frame = tk.Frame(root, bg=BG)
-meter_frame.pack(pady=5)
+    # one Label per line; an update only touches the StringVars whose text changed
+    status_vars = {}
+    for row, (key, caption) in enumerate(STATUS_FIELDS):
+        tk.Label(status_display, text=caption, bg=panel_bg, fg=panel_fg,
+                 font=("Consolas", 12), anchor="w").grid(row=row, column=0, sticky="w", padx=(4, 12))
+        status_vars[key] = tk.StringVar(value="--")
+        tk.Label(status_display, textvariable=status_vars[key], bg=panel_bg, fg=panel_fg,
+                 font=("Consolas", 12), anchor="w", width=48).grid(row=row, column=1, sticky="w")
 
-speed_label = tk.Label(meter_frame, text="Speed: 0", bg=BG, fg=FG, font=("Segoe UI", 11))
-alt_label = tk.Label(meter_frame, text="Altitude: 0", bg=BG, fg=FG, font=("Segoe UI", 11))
-thrust_label = tk.Label(meter_frame, text="Thrust: 0", bg=BG, fg=FG, font=("Segoe UI", 11))
+    # ---------------- METERS ----------------
+    meter_frame = tk.Frame(root, bg=bg)
+    meter_frame.pack(pady=5)
 
-speed_label.grid(row=0, column=0, padx=25)
-alt_label.grid(row=0, column=1, padx=25)
-thrust_label.grid(row=0, column=2, padx=25)
+    speed_label = CachedLabel(meter_frame, text="Speed: 0", bg=bg, fg=fg, font=("Segoe UI", 11))
+    alt_label = CachedLabel(meter_frame, text="Altitude: 0", bg=bg, fg=fg, font=("Segoe UI", 11))
+    thrust_label = CachedLabel(meter_frame, text="Thrust: 0", bg=bg, fg=fg, font=("Segoe UI", 11))
 
-# ---------------- BOTTOM CONTROLS ----------------
-BOTTOM_SPACER = tk.Frame(root, height=40, bg=BG)
-BOTTOM_SPACER.pack()
+    speed_label.grid(row=0, column=0, padx=25)
+    alt_label.grid(row=0, column=1, padx=25)
+    thrust_label.grid(row=0, column=2, padx=25)
 
-bottom_bar = tk.Frame(root, bg=BG)
-bottom_bar.pack(pady=5)
+    # ---------------- BOTTOM CONTROLS ----------------
+    bottom_spacer = tk.Frame(root, height=40, bg=bg)
+    bottom_spacer.pack()
 
-btn_area = tk.Frame(bottom_bar, bg=BG)
-btn_area.grid(row=0, column=1, padx=20)
+    bottom_bar = tk.Frame(root, bg=bg)
+    bottom_bar.pack(pady=5)
 
-def start_computing():
-    global running
-    running = True
-    update_data()
+    btn_area = tk.Frame(bottom_bar, bg=bg)
+    btn_area.grid(row=0, column=1, padx=20)
 
-def stop_computing():
-    global running
-    running = False
+    start_btn = ttk.Button(btn_area, text="START")
+    stop_btn = ttk.Button(btn_area, text="STOP")
+    start_btn.pack(pady=5, ipadx=10)
+    stop_btn.pack(pady=5, ipadx=10)
+
+    return Display(palette, warning_display, speed_label, alt_label, thrust_label,
+                   status_vars, start_btn, stop_btn)
 
-start_btn = ttk.Button(btn_area, text="START", command=start_computing)
-stop_btn = ttk.Button(btn_area, text="STOP", command=stop_computing)
-start_btn.pack(pady=5, ipadx=10)
-stop_btn.pack(pady=5, ipadx=10)
 
 # ---------------- THE LIVE UPDATE LOOP ----------------
-def update_data():
-    global running, state
-    if not running:
-        return
+def advance_state(s):
+    """Advance the simulated state by one tick and return the kernel inputs."""
+    sin = math.sin
 
     # Time step
-    state["time_seconds"] += 1
-    t = state["time_seconds"]
+    t = s.time_seconds + 1.0
 
     # Randomized dynamics for realism
-    state["velocity_mps"] = max(0, 60 + 20 * math.sin(t / 10) + random.uniform(-4, 4))
-    state["altitude_m"] = max(0, 400 + 200 * math.sin(t / 18) + random.uniform(-8, 8))
-    state["angle_of_attack_deg"] = max(-5, min(15, 2 + 3 * math.sin(t / 8) + random.uniform(-1, 1)))
-    state["flap_angle_deg"] = 10 if state["altitude_m"] < 50 else 0
-    state["bank_angle_deg"] = 15 * math.sin(t / 6)
-    state["thrust_newtons"] = 12000 + 1500 * math.sin(t / 12)
-
-    v = state["velocity_mps"]
-    alt = state["altitude_m"]
-    aoa = state["angle_of_attack_deg"]
-    flaps = state["flap_angle_deg"]
-    bank = state["bank_angle_deg"]
-    thrust = state["thrust_newtons"]
-    target_alt = state["target_altitude_m"]
-
-    # Physics
-    lc = calculate_lift_coefficient(aoa, flaps)
-    lift = calculate_lift(v, lc)
-    dc = calculate_drag_coefficient(lc)
-    drag = calculate_drag(v, dc)
-
-    # Algorithms
-    r_take = takeoff_algorithm(v, alt, aoa, flaps)
-    r_land = landing_algorithm(v, alt, thrust, aoa, flaps)
-    r_stall = stall_algorithm(v, aoa, bank, flaps)
-    r_flight = inflight_algorithm(v, alt, aoa, flaps, target_alt, thrust)
-    r_turn = turn_algorithm(v, bank)
-    r_alt = altitude_hold_algorithm(alt, target_alt)
+    noise_v, noise_alt, noise_aoa = next(noise)
+    v = max(0.0, 60 + 20 * sin(t / 10) + noise_v)
+    alt = max(0.0, 400 + 200 * sin(t / 18) + noise_alt)
+    aoa = max(-5.0, min(15.0, 2 + 3 * sin(t / 8) + noise_aoa))
+    flaps = 10.0 if alt < 50 else 0.0
+    bank = 15 * sin(t / 6)
+    thrust = 12000 + 1500 * sin(t / 12)
+
+    s.time_seconds = t
+    s.velocity_mps = v
+    s.altitude_m = alt
+    s.angle_of_attack_deg = aoa
+    s.flap_angle_deg = flaps
+    s.bank_angle_deg = bank
+    s.thrust_newtons = thrust
+    return v, alt, aoa, flaps, bank, thrust, s.target_altitude_m
+
+
+def physics_worker(result_q, stop_event):
+    """
+    Background loop: advance the state and run the physics once per tick,
+    posting (inputs, frame) to result_q. Ticks are scheduled against
+    time.monotonic() so compute time doesn't make the interval drift.
+    Tk is never touched from this thread.
+    """
+    interval_s = UPDATE_INTERVAL_MS / 1000.0
+    next_tick = time.monotonic()
+    while not stop_event.is_set():
+        inputs = advance_state(state)
+        frame = compute_flight_frame(*inputs)
+        history.append(state, frame)
+        result_q.put((inputs, frame))
+
+        next_tick += interval_s
+        now = time.monotonic()
+        if next_tick < now:
+            # fell behind (e.g. suspended); resync instead of bursting
+            next_tick = now
+        stop_event.wait(next_tick - now)
+
+
+def apply_frame(display, inputs, frame):
+    """Push one computed frame onto the widgets (Tk thread only)."""
+    v, alt, aoa, flaps, bank, thrust, target_alt = inputs
+    lift = frame.lift_newtons
+    drag = frame.drag_newtons
+    lc = frame.lift_coefficient
+    dc = frame.drag_coefficient
+
+    # format each value shown in both the meters and the status box only once
+    speed_text = f"{v:.1f} m/s"
+    alt_text = f"{alt:.1f} m"
+    thrust_text = f"{thrust:.0f} N"
 
     # Update meters
-    speed_label.config(text=f"Speed: {v:.1f} m/s")
-    alt_label.config(text=f"Altitude: {alt:.1f} m")
-    thrust_label.config(text=f"Thrust: {thrust:.0f} N")
+    display.speed.set("Speed: " + speed_text)
+    display.altitude.set("Altitude: " + alt_text)
+    display.thrust.set("Thrust: " + thrust_text)
 
     # Update warnings
-    if r_stall["stall"]:
-        warning_display.config(text="STALL WARNING!", fg="red")
+    if frame.stall:
+        display.warning.set("STALL WARNING!", fg="red")
     elif thrust < 2000:
-        warning_display.config(text="LOW THRUST", fg="yellow")
+        display.warning.set("LOW THRUST", fg=display.palette["caution"])
     else:
-        warning_display.config(text="No Active Warnings", fg=ACCENT)
-
-    # Update big status box
-    status_display.delete("1.0", tk.END)
-    status_display.insert(tk.END,
-f"""
-Velocity: {v:.1f} m/s
-Altitude: {alt:.1f} m
-AoA: {aoa:.2f}°
-Bank: {bank:.1f}°
-Flaps: {flaps}°
-Thrust: {thrust:.0f} N
-
-Lift: {lift:.0f} N    Drag: {drag:.0f} N
-Lift Coef: {lc:.3f}   Drag Coef: {dc:.4f}
-
-TAKEOFF → {r_take['status']}
-LANDING → {r_land['status']}
-STALL → {r_stall['stall']}
-IN-FLIGHT → {r_flight['mode']}
-TURN → Radius: {r_turn['turn_radius_m']:.1f} m   Load: {r_turn['load_factor']:.2f}
-ALT HOLD → {r_alt['command']}   Climb Rate: {r_alt['commanded_climb_rate_mps']:.2f} m/s
-"""
-    )
-
-    # Schedule next update
-    root.after(UPDATE_INTERVAL_MS, update_data)
-
-root.mainloop()
-
-
+        display.warning.set("No Active Warnings", fg=display.palette["accent"])
+
+    # Update status lines (dirty check: only lines whose text changed reach Tk)
+    new = {
+        "velocity": speed_text,
+        "altitude": alt_text,
+        "aoa": f"{aoa:.2f}°",
+        "bank": f"{bank:.1f}°",
+        "flaps": f"{flaps:.0f}°",
+        "thrust": thrust_text,
+        "lift": f"{lift:.0f} N",
+        "drag": f"{drag:.0f} N",
+        "cl": f"{lc:.3f}",
+        "cd": f"{dc:.4f}",
+        "takeoff": TAKEOFF_STATUS[frame.takeoff_status],
+        "landing": LANDING_STATUS[frame.landing_status],
+        "stall": STALL_TEXT[frame.stall],
+        "inflight": INFLIGHT_MODES[frame.inflight_mode],
+        "turn": f"Radius: {frame.turn_radius_m:.1f} m   Load: {frame.load_factor:.2f}",
+        "alt_hold": f"{ALT_HOLD_PREFIX[frame.altitude_hold_command]}{frame.commanded_climb_rate_mps:.2f} m/s",
+    }
+    status_vars = display.status_vars
+    prev_display = display.prev_display
+    for key, text in new.items():
+        if text != prev_display.get(key):
+            status_vars[key].set(text)
+            prev_display[key] = text
+
+
+def poll_results(root, display, result_q):
+    """Drain the worker's queue, draw only the newest frame, and re-arm."""
+    latest = None
+    try:
+        while True:
+            latest = result_q.get_nowait()
+    except queue.Empty:
+        pass
+    if latest is not None:
+        apply_frame(display, *latest)
+    root.after(POLL_INTERVAL_MS, poll_results, root, display, result_q)
+
+
+def schedule_updates(root, display):
+    """Wire START/STOP to the physics worker and start polling for its frames."""
+    result_q = queue.Queue()
+    worker = None
+    stop_event = threading.Event()
+
+    def start_computing():
+        nonlocal worker, stop_event
+        if worker is not None and worker.is_alive():
+            if not stop_event.is_set():
+                return
+            worker.join()
+        stop_event = threading.Event()
+        worker = threading.Thread(target=physics_worker, args=(result_q, stop_event), daemon=True)
+        worker.start()
+
+    def stop_computing():
+        stop_event.set()
+
+    display.start_btn.config(command=start_computing)
+    display.stop_btn.config(command=stop_computing)
+    root.after_idle(poll_results, root, display, result_q)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flight computer GUI")
+    parser.add_argument("--theme", choices=sorted(THEMES), default="dark")
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    display = build_ui(root, THEMES[args.theme])
+    schedule_updates(root, display)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
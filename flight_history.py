@@ -0,0 +1,55 @@
+# flight_history.py
+"""
+Fixed-size time-series history for the Flight Computer.
+Stores one float32 ring buffer per field (structure of arrays), so
+min / max / mean over the recorded window are single NumPy calls.
+"""
+
+import numpy as np
+
+HISTORY_SIZE = 3600        # samples (1 hour at 1 Hz)
+
+
+class HistoryBuffer:
+    """Ring buffer of named float32 columns, filled from attribute-style records."""
+
+    __slots__ = ("idx", "n", "count", "arrays")
+
+    def __init__(self, fields, size: int = HISTORY_SIZE):
+        self.idx = 0
+        self.n = size
+        self.count = 0
+        self.arrays = {name: np.empty(size, dtype=np.float32) for name in fields}
+
+    def append(self, *records) -> None:
+        """
+        Write every field at the current slot, overwriting the oldest when full.
+        Each field is read from the first of records that has it, so one tick's
+        inputs and computed frame can be logged together.
+        """
+        i = self.idx
+        for name, array in self.arrays.items():
+            for record in records:
+                value = getattr(record, name, None)
+                if value is not None:
+                    array[i] = value
+                    break
+            else:
+                raise AttributeError(f"no record has field {name!r}")
+        self.idx = (i + 1) % self.n
+        if self.count < self.n:
+            self.count += 1
+
+    def series(self, name: str) -> np.ndarray:
+        """Return the recorded values of one field, oldest first (a copy once the buffer has wrapped)."""
+        array = self.arrays[name]
+        if self.count < self.n:
+            return array[:self.count]
+        return np.concatenate((array[self.idx:], array[:self.idx]))
+
+    def stats(self, name: str) -> tuple:
+        """Return (min, max, mean) of one field over the recorded window."""
+        if self.count == 0:
+            return (float("nan"),) * 3
+        window = self.arrays[name][:self.count]
+        return float(window.min()), float(window.max()), float(window.mean(dtype=np.float64))
@@ -2,9 +2,23 @@
 """
 Physics and algorithm module for the Flight Computer.
 Contains clear functions for lift, drag, stall, takeoff, landing, turns, altitude-hold.
+
+Set FLARE_DISABLE_JIT=1 before importing to run every kernel as plain Python
+(maps onto NUMBA_DISABLE_JIT; handy for debugging and coverage).
+Set FLARE_DISABLE_AOT=1 to ignore a flight_physics_compiled build.
 """
 
+import hashlib
 import math
+import os
+import warnings
+from typing import Final, NamedTuple
+
+if os.environ.get("FLARE_DISABLE_JIT") == "1":
+    os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
+import numpy as np
+from numba import njit, prange
 
 # ----- constants -----
 AIR_DENSITY = 1.225        # kg/m^3
@@ -20,9 +34,25 @@ DRAG_COEFFICIENT_ZERO = 0.02
 INDUCED_DRAG_FACTOR = 0.045
 MAX_THRUST = 20000.0       # N
 
+# derived constants (folded once at import)
+WEIGHT_N: Final[float] = AIRCRAFT_MASS * GRAVITY
+_STALL_NUMERATOR: Final[float] = 2.0 * WEIGHT_N / (AIR_DENSITY * WING_AREA)
+STALL_SPEED_CLEAN: Final[float] = math.sqrt(_STALL_NUMERATOR / LIFT_COEFFICIENT_MAX)
+
+
+# ----- compiler flags -----
+
+# The kernels are compute-bound: a handful of scalar loads feeding several
+# multiplies, a sqrt and trig, so relaxed FP semantics pay off (FMA
+# contraction, reciprocal 1/cos, SVML sin/cos/sqrt when the Intel runtime is
+# installed). "nnan"/"ninf" are deliberately left out: the level-flight turn
+# radius is math.inf, and LLVM may not assume infinities never occur.
+FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
 
 # ----- helper physics functions -----
 
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
 def calculate_lift_coefficient(angle_of_attack_deg: float, flap_angle_deg: float) -> float:
     """Return approximate lift coefficient (linear + flap effect)."""
     return (LIFT_COEFFICIENT_ZERO
@@ -30,32 +60,37 @@ def calculate_lift_coefficient(angle_of_attack_deg: float, flap_angle_deg: float
             + 0.01 * flap_angle_deg)
 
 
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
 def calculate_lift(velocity_mps: float, lift_coefficient: float) -> float:
     """Return lift force in newtons."""
     return 0.5 * AIR_DENSITY * velocity_mps ** 2 * WING_AREA * lift_coefficient
 
 
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
 def calculate_drag_coefficient(lift_coefficient: float) -> float:
     """Return drag coefficient (parasitic + induced)."""
     return DRAG_COEFFICIENT_ZERO + INDUCED_DRAG_FACTOR * lift_coefficient ** 2
 
 
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
 def calculate_drag(velocity_mps: float, drag_coefficient: float) -> float:
     """Return drag force in newtons."""
     return 0.5 * AIR_DENSITY * velocity_mps ** 2 * WING_AREA * drag_coefficient
 
 
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
 def calculate_weight() -> float:
     """Return aircraft weight in newtons."""
-    return AIRCRAFT_MASS * GRAVITY
+    return WEIGHT_N
 
 
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
 def calculate_stall_speed_for_clean_configuration() -> float:
     """Return theoretical stall speed (m/s) for clean (no-flap) config using CL_max."""
-    weight = calculate_weight()
-    return math.sqrt(2.0 * weight / (AIR_DENSITY * WING_AREA * LIFT_COEFFICIENT_MAX))
+    return STALL_SPEED_CLEAN
 
 
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
 def calculate_turn_radius(velocity_mps: float, bank_angle_deg: float) -> float:
     """Return turn radius in meters. If bank is zero, return math.inf."""
     if abs(bank_angle_deg) < 1e-6:
@@ -64,47 +99,44 @@ def calculate_turn_radius(velocity_mps: float, bank_angle_deg: float) -> float:
     return velocity_mps ** 2 / (GRAVITY * math.tan(bank_radians))
 
 
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
 def calculate_load_factor(bank_angle_deg: float) -> float:
     """Return load factor n = 1 / cos(phi)."""
     bank_radians = math.radians(bank_angle_deg)
     return 1.0 / math.cos(bank_radians)
 
 
-# ----- algorithm functions (each clearly named) -----
+# ----- status lookup tables (index = status code returned by the jitted cores) -----
 
-def takeoff_algorithm(velocity_mps: float, altitude_m: float,
-                      angle_of_attack_deg: float, flap_angle_deg: float) -> dict:
-    """
-    TAKEOFF ALGORITHM:
-    - Uses lift >= weight to decide takeoff readiness.
-    Returns dict containing status, lift, weight, lift_coefficient.
-    """
+TAKEOFF_STATUS = ("ROLLING", "TAKEOFF READY (ROTATE)", "AIRBORNE")
+LANDING_STATUS = ("NOT LANDING", "APPROACH", "FINAL", "TOUCHDOWN")
+INFLIGHT_MODES = ("CRUISE", "CLIMB", "DESCEND")
+ALTITUDE_HOLD_COMMANDS = ("HOLD", "CLIMB", "DESCEND")
+
+
+# ----- jitted numeric cores (scalars / tuples only, no dicts) -----
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _takeoff_core(velocity_mps: float, altitude_m: float, angle_of_attack_deg: float,
+                  flap_angle_deg: float) -> tuple[int, float, float, float]:
+    """Return (status_code, lift, weight, lift_coefficient) for the takeoff algorithm."""
     lift_coefficient = calculate_lift_coefficient(angle_of_attack_deg, flap_angle_deg)
     lift_force = calculate_lift(velocity_mps, lift_coefficient)
     weight_newtons = calculate_weight()
 
     if altitude_m > 0.1 and lift_force >= weight_newtons:
-        status = "AIRBORNE"
+        status_code = 2
     elif lift_force >= weight_newtons and altitude_m <= 0.1:
-        status = "TAKEOFF READY (ROTATE)"
+        status_code = 1
     else:
-        status = "ROLLING"
-
-    return {
-        "algorithm": "TAKEOFF ALGORITHM",
-        "status": status,
-        "lift_newtons": lift_force,
-        "weight_newtons": weight_newtons,
-        "lift_coefficient": lift_coefficient
-    }
+        status_code = 0
+    return status_code, lift_force, weight_newtons, lift_coefficient
 
 
-def landing_algorithm(velocity_mps: float, altitude_m: float,
-                      thrust_newtons: float, angle_of_attack_deg: float, flap_angle_deg: float) -> dict:
-    """
-    LANDING ALGORITHM:
-    - Uses altitude, speed and drag vs thrust to decide landing phases.
-    """
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _landing_core(velocity_mps: float, altitude_m: float, thrust_newtons: float,
+                  angle_of_attack_deg: float, flap_angle_deg: float) -> tuple[int, float]:
+    """Return (status_code, drag) for the landing algorithm."""
     lift_coefficient = calculate_lift_coefficient(angle_of_attack_deg, flap_angle_deg)
     drag_coefficient = calculate_drag_coefficient(lift_coefficient)
     drag_force = calculate_drag(velocity_mps, drag_coefficient)
@@ -114,34 +146,23 @@ def landing_algorithm(velocity_mps: float, altitude_m: float,
     touchdown_condition = final_condition and (drag_force >= thrust_newtons)
 
     if touchdown_condition:
-        status = "TOUCHDOWN"
+        status_code = 3
     elif final_condition:
-        status = "FINAL"
+        status_code = 2
     elif approach_condition:
-        status = "APPROACH"
+        status_code = 1
     else:
-        status = "NOT LANDING"
+        status_code = 0
+    return status_code, drag_force
 
-    return {
-        "algorithm": "LANDING ALGORITHM",
-        "status": status,
-        "drag_newtons": drag_force,
-        "thrust_newtons": thrust_newtons
-    }
 
-
-def stall_algorithm(velocity_mps: float, angle_of_attack_deg: float, bank_angle_deg: float,
-                    flap_angle_deg: float) -> dict:
-    """
-    STALL ALGORITHM:
-    - Stall if angle_of_attack exceeds ~15 deg or velocity below turn-adjusted stall.
-    """
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _stall_core(velocity_mps: float, angle_of_attack_deg: float, bank_angle_deg: float,
+                flap_angle_deg: float) -> tuple[bool, float, float, float]:
+    """Return (stall_flag, clean_stall, flaps_stall, turn_stall) for the stall algorithm."""
     base_stall_speed = calculate_stall_speed_for_clean_configuration()
     # flaps increase CL_max slightly (approx), reduce stall speed a bit
-    flap_cl_adjustment = 0.01 * flap_angle_deg
-    effective_cl_max = LIFT_COEFFICIENT_MAX + flap_cl_adjustment
-    weight_newtons = calculate_weight()
-    stall_speed_with_flaps = math.sqrt(2.0 * weight_newtons / (AIR_DENSITY * WING_AREA * effective_cl_max))
+    stall_speed_with_flaps = math.sqrt(_STALL_NUMERATOR / (LIFT_COEFFICIENT_MAX + 0.01 * flap_angle_deg))
 
     # load factor in a bank increases stall speed
     load_factor = calculate_load_factor(bank_angle_deg)
@@ -151,76 +172,450 @@ def stall_algorithm(velocity_mps: float, angle_of_attack_deg: float, bank_angle_
     stall_by_speed = velocity_mps <= stall_speed_in_turn
 
     stall_flag = stall_by_aoa or stall_by_speed
+    return stall_flag, base_stall_speed, stall_speed_with_flaps, stall_speed_in_turn
 
-    return {
-        "algorithm": "STALL ALGORITHM",
-        "stall": stall_flag,
-        "stall_speed_clean_mps": base_stall_speed,
-        "stall_speed_with_flaps_mps": stall_speed_with_flaps,
-        "stall_speed_in_turn_mps": stall_speed_in_turn,
-        "angle_of_attack_deg": angle_of_attack_deg
-    }
 
-
-def inflight_algorithm(velocity_mps: float, altitude_m: float,
-                       angle_of_attack_deg: float, flap_angle_deg: float,
-                       target_altitude_m: float, thrust_newtons: float) -> dict:
-    """
-    IN-FLIGHT ALGORITHM:
-    - Compares lift and weight and altitude error to pick CLIMB / DESCEND / CRUISE.
-    """
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _inflight_core(velocity_mps: float, altitude_m: float, angle_of_attack_deg: float,
+                   flap_angle_deg: float, target_altitude_m: float) -> tuple[int, float, float]:
+    """Return (mode_code, lift, weight) for the in-flight algorithm."""
     lift_coefficient = calculate_lift_coefficient(angle_of_attack_deg, flap_angle_deg)
     lift_force = calculate_lift(velocity_mps, lift_coefficient)
     weight_newtons = calculate_weight()
 
     if lift_force < weight_newtons and altitude_m < target_altitude_m - 5.0:
-        mode = "CLIMB"
+        mode_code = 1
     elif lift_force > weight_newtons and altitude_m > target_altitude_m + 5.0:
-        mode = "DESCEND"
+        mode_code = 2
     else:
-        mode = "CRUISE"
+        mode_code = 0
+    return mode_code, lift_force, weight_newtons
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _turn_core(velocity_mps: float, bank_angle_deg: float) -> tuple[float, float]:
+    """Return (turn_radius, load_factor) for the turn algorithm."""
+    radius = calculate_turn_radius(velocity_mps, bank_angle_deg)
+    load_factor = calculate_load_factor(bank_angle_deg) if abs(bank_angle_deg) > 1e-6 else 1.0
+    return radius, load_factor
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _altitude_hold_core(altitude_m: float, target_altitude_m: float,
+                        proportional_gain: float) -> tuple[int, float, float]:
+    """Return (command_code, climb_rate, altitude_error) for the altitude-hold algorithm."""
+    error_m = target_altitude_m - altitude_m
+    commanded_climb_rate_mps = max(-10.0, min(10.0, proportional_gain * error_m))
+
+    if abs(error_m) <= 2.0:
+        command_code = 0
+    elif commanded_climb_rate_mps > 0:
+        command_code = 1
+    else:
+        command_code = 2
+    return command_code, commanded_climb_rate_mps, error_m
+
+
+# ----- algorithm result types -----
+
+class TakeoffResult(NamedTuple):
+    status: str
+    lift_newtons: float
+    weight_newtons: float
+    lift_coefficient: float
+
+
+class LandingResult(NamedTuple):
+    status: str
+    drag_newtons: float
+    thrust_newtons: float
+
+
+class StallResult(NamedTuple):
+    stall: bool
+    stall_speed_clean_mps: float
+    stall_speed_with_flaps_mps: float
+    stall_speed_in_turn_mps: float
+    angle_of_attack_deg: float
 
-    return {
-        "algorithm": "IN-FLIGHT ALGORITHM",
-        "mode": mode,
-        "lift_newtons": lift_force,
-        "weight_newtons": weight_newtons
-    }
 
+class InflightResult(NamedTuple):
+    mode: str
+    lift_newtons: float
+    weight_newtons: float
 
-def turn_algorithm(velocity_mps: float, bank_angle_deg: float) -> dict:
+
+class TurnResult(NamedTuple):
+    turn_radius_m: float
+    load_factor: float
+
+
+class AltitudeHoldResult(NamedTuple):
+    command: str
+    commanded_climb_rate_mps: float
+    altitude_error_m: float
+
+
+# ----- algorithm functions (each clearly named) -----
+
+def takeoff_algorithm(velocity_mps: float, altitude_m: float,
+                      angle_of_attack_deg: float, flap_angle_deg: float) -> TakeoffResult:
+    """
+    TAKEOFF ALGORITHM:
+    - Uses lift >= weight to decide takeoff readiness.
+    Returns status, lift, weight, lift_coefficient.
+    """
+    status_code, lift_force, weight_newtons, lift_coefficient = _takeoff_core(
+        velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg)
+
+    return TakeoffResult(TAKEOFF_STATUS[status_code], lift_force, weight_newtons, lift_coefficient)
+
+
+def landing_algorithm(velocity_mps: float, altitude_m: float,
+                      thrust_newtons: float, angle_of_attack_deg: float, flap_angle_deg: float) -> LandingResult:
+    """
+    LANDING ALGORITHM:
+    - Uses altitude, speed and drag vs thrust to decide landing phases.
+    """
+    status_code, drag_force = _landing_core(
+        velocity_mps, altitude_m, thrust_newtons, angle_of_attack_deg, flap_angle_deg)
+
+    return LandingResult(LANDING_STATUS[status_code], drag_force, thrust_newtons)
+
+
+def stall_algorithm(velocity_mps: float, angle_of_attack_deg: float, bank_angle_deg: float,
+                    flap_angle_deg: float) -> StallResult:
+    """
+    STALL ALGORITHM:
+    - Stall if angle_of_attack exceeds ~15 deg or velocity below turn-adjusted stall.
+    """
+    stall_flag, base_stall_speed, stall_speed_with_flaps, stall_speed_in_turn = _stall_core(
+        velocity_mps, angle_of_attack_deg, bank_angle_deg, flap_angle_deg)
+
+    return StallResult(stall_flag, base_stall_speed, stall_speed_with_flaps, stall_speed_in_turn,
+                       angle_of_attack_deg)
+
+
+def inflight_algorithm(velocity_mps: float, altitude_m: float,
+                       angle_of_attack_deg: float, flap_angle_deg: float,
+                       target_altitude_m: float, thrust_newtons: float) -> InflightResult:
+    """
+    IN-FLIGHT ALGORITHM:
+    - Compares lift and weight and altitude error to pick CLIMB / DESCEND / CRUISE.
+    """
+    mode_code, lift_force, weight_newtons = _inflight_core(
+        velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg, target_altitude_m)
+
+    return InflightResult(INFLIGHT_MODES[mode_code], lift_force, weight_newtons)
+
+
+def turn_algorithm(velocity_mps: float, bank_angle_deg: float) -> TurnResult:
     """
     TURN ALGORITHM:
     - Computes turn radius and load factor.
     """
-    radius = calculate_turn_radius(velocity_mps, bank_angle_deg)
-    load_factor = calculate_load_factor(bank_angle_deg) if abs(bank_angle_deg) > 1e-6 else 1.0
+    radius, load_factor = _turn_core(velocity_mps, bank_angle_deg)
 
-    return {
-        "algorithm": "TURN ALGORITHM",
-        "turn_radius_m": radius,
-        "load_factor": load_factor
-    }
+    return TurnResult(radius, load_factor)
 
 
-def altitude_hold_algorithm(altitude_m: float, target_altitude_m: float, proportional_gain: float = 0.4) -> dict:
+def altitude_hold_algorithm(altitude_m: float, target_altitude_m: float, proportional_gain: float = 0.4) -> AltitudeHoldResult:
     """
     ALTITUDE HOLD ALGORITHM:
     - Very simple proportional controller returning a climb/descend command.
     """
+    command_code, commanded_climb_rate_mps, error_m = _altitude_hold_core(
+        altitude_m, target_altitude_m, proportional_gain)
+
+    return AltitudeHoldResult(ALTITUDE_HOLD_COMMANDS[command_code], commanded_climb_rate_mps, error_m)
+
+
+# ----- fused per-frame kernel -----
+
+class FlightFrame(NamedTuple):
+    """Everything the GUI needs for one tick; status fields index the *_STATUS tables."""
+    lift_coefficient: float
+    lift_newtons: float
+    drag_coefficient: float
+    drag_newtons: float
+    weight_newtons: float
+    stall_speed_in_turn_mps: float
+    load_factor: float
+    turn_radius_m: float
+    takeoff_status: int
+    landing_status: int
+    inflight_mode: int
+    stall: bool
+    altitude_hold_command: int
+    commanded_climb_rate_mps: float
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def compute_flight_frame(velocity_mps: float, altitude_m: float, angle_of_attack_deg: float,
+                         flap_angle_deg: float, bank_angle_deg: float, thrust_newtons: float,
+                         target_altitude_m: float, proportional_gain: float = 0.4) -> FlightFrame:
+    """
+    Run all six algorithms in one pass, computing the shared terms
+    (dynamic pressure, CL, CD, weight, load factor) only once.
+    """
+    dynamic_pressure_area = 0.5 * AIR_DENSITY * velocity_mps * velocity_mps * WING_AREA
+    weight_newtons = WEIGHT_N
+    lift_coefficient = calculate_lift_coefficient(angle_of_attack_deg, flap_angle_deg)
+    drag_coefficient = calculate_drag_coefficient(lift_coefficient)
+    lift_force = dynamic_pressure_area * lift_coefficient
+    drag_force = dynamic_pressure_area * drag_coefficient
+
+    # takeoff
+    if altitude_m > 0.1 and lift_force >= weight_newtons:
+        takeoff_status = 2
+    elif lift_force >= weight_newtons:
+        takeoff_status = 1
+    else:
+        takeoff_status = 0
+
+    # landing
+    final_condition = altitude_m <= 10.0 and velocity_mps <= 16.7
+    if final_condition and drag_force >= thrust_newtons:
+        landing_status = 3
+    elif final_condition:
+        landing_status = 2
+    elif altitude_m < 200.0 and velocity_mps < 55.0:
+        landing_status = 1
+    else:
+        landing_status = 0
+
+    # bank terms shared by stall and turn: one radians + sin/cos pair instead of radians/cos/radians/tan
+    bank_radians = math.radians(bank_angle_deg)
+    cos_bank = math.cos(bank_radians)
+    sin_bank = math.sin(bank_radians)
+    load_factor = 1.0 / cos_bank
+
+    # stall (flaps raise CL_max, load factor in a bank raises stall speed)
+    stall_speed_with_flaps = math.sqrt(_STALL_NUMERATOR / (LIFT_COEFFICIENT_MAX + 0.01 * flap_angle_deg))
+    stall_speed_in_turn = stall_speed_with_flaps * math.sqrt(load_factor)
+    stall_flag = angle_of_attack_deg >= 15.0 or velocity_mps <= stall_speed_in_turn
+
+    # in-flight
+    if lift_force < weight_newtons and altitude_m < target_altitude_m - 5.0:
+        inflight_mode = 1
+    elif lift_force > weight_newtons and altitude_m > target_altitude_m + 5.0:
+        inflight_mode = 2
+    else:
+        inflight_mode = 0
+
+    # turn (r = v^2 / (g tan phi) = v^2 cos phi / (g sin phi))
+    if abs(bank_angle_deg) < 1e-6:
+        turn_radius = math.inf
+    else:
+        turn_radius = velocity_mps * velocity_mps * cos_bank / (GRAVITY * sin_bank)
+
+    # altitude hold
     error_m = target_altitude_m - altitude_m
     commanded_climb_rate_mps = max(-10.0, min(10.0, proportional_gain * error_m))
-
     if abs(error_m) <= 2.0:
-        command = "HOLD"
+        altitude_hold_command = 0
     elif commanded_climb_rate_mps > 0:
-        command = "CLIMB"
+        altitude_hold_command = 1
     else:
-        command = "DESCEND"
+        altitude_hold_command = 2
+
+    return FlightFrame(lift_coefficient, lift_force, drag_coefficient, drag_force, weight_newtons,
+                       stall_speed_in_turn, load_factor, turn_radius,
+                       takeoff_status, landing_status, inflight_mode, stall_flag,
+                       altitude_hold_command, commanded_climb_rate_mps)
+
+
+# kernels call the jitted frame through this alias, so an AOT build can rebind the public name
+_flight_frame_kernel = compute_flight_frame
+
+
+# ----- batched (vectorised) evaluation -----
+
+def run_all_algorithms_batch(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg,
+                             bank_angle_deg, thrust_newtons, target_altitude_m,
+                             proportional_gain: float = 0.4) -> dict:
+    """
+    Vectorised counterpart of compute_flight_frame for sweeps and log replay.
+    Inputs are array-likes (broadcast against each other); returns a dict of
+    ndarrays keyed like the FlightFrame fields.
+    """
+    v, alt, aoa, flaps, bank, thrust, target_alt = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (velocity_mps, altitude_m, angle_of_attack_deg,
+                                                     flap_angle_deg, bank_angle_deg, thrust_newtons,
+                                                     target_altitude_m)))
+
+    dynamic_pressure_area = 0.5 * AIR_DENSITY * v * v * WING_AREA
+    lift_coefficient = LIFT_COEFFICIENT_ZERO + LIFT_COEFFICIENT_ALPHA * aoa + 0.01 * flaps
+    drag_coefficient = DRAG_COEFFICIENT_ZERO + INDUCED_DRAG_FACTOR * lift_coefficient * lift_coefficient
+    lift_force = dynamic_pressure_area * lift_coefficient
+    drag_force = dynamic_pressure_area * drag_coefficient
+
+    takeoff_status = np.where(lift_force >= WEIGHT_N, np.where(alt > 0.1, 2, 1), 0)
+
+    final_condition = (alt <= 10.0) & (v <= 16.7)
+    landing_status = np.select(
+        [final_condition & (drag_force >= thrust), final_condition, (alt < 200.0) & (v < 55.0)],
+        [3, 2, 1], 0)
+
+    bank_radians = np.radians(bank)
+    cos_bank = np.cos(bank_radians)
+    load_factor = 1.0 / cos_bank
+    stall_speed_in_turn = np.sqrt(_STALL_NUMERATOR / (LIFT_COEFFICIENT_MAX + 0.01 * flaps)) * np.sqrt(load_factor)
+    stall_flag = (aoa >= 15.0) | (v <= stall_speed_in_turn)
+
+    inflight_mode = np.select(
+        [(lift_force < WEIGHT_N) & (alt < target_alt - 5.0), (lift_force > WEIGHT_N) & (alt > target_alt + 5.0)],
+        [1, 2], 0)
+
+    level = np.abs(bank) < 1e-6
+    sin_bank = np.sin(np.where(level, 1.0, bank_radians))
+    turn_radius = np.where(level, np.inf, v * v * cos_bank / (GRAVITY * sin_bank))
+
+    error_m = target_alt - alt
+    commanded_climb_rate_mps = np.clip(proportional_gain * error_m, -10.0, 10.0)
+    altitude_hold_command = np.where(np.abs(error_m) <= 2.0, 0, np.where(commanded_climb_rate_mps > 0, 1, 2))
 
     return {
-        "algorithm": "ALTITUDE HOLD ALGORITHM",
-        "command": command,
+        "lift_coefficient": lift_coefficient,
+        "lift_newtons": lift_force,
+        "drag_coefficient": drag_coefficient,
+        "drag_newtons": drag_force,
+        "weight_newtons": np.full_like(v, WEIGHT_N),
+        "stall_speed_in_turn_mps": stall_speed_in_turn,
+        "load_factor": load_factor,
+        "turn_radius_m": turn_radius,
+        "takeoff_status": takeoff_status.astype(np.int8),
+        "landing_status": landing_status.astype(np.int8),
+        "inflight_mode": inflight_mode.astype(np.int8),
+        "stall": stall_flag,
+        "altitude_hold_command": altitude_hold_command.astype(np.int8),
         "commanded_climb_rate_mps": commanded_climb_rate_mps,
-        "altitude_error_m": error_m
     }
+
+
+@njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+def _batch_core(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg, bank_angle_deg,
+                thrust_newtons, target_altitude_m, proportional_gain,
+                out_lift_coefficient, out_lift, out_drag_coefficient, out_drag, out_stall_speed_in_turn,
+                out_load_factor, out_turn_radius, out_takeoff_status, out_landing_status,
+                out_inflight_mode, out_stall, out_altitude_hold_command, out_climb_rate):
+    """Fill the preallocated output arrays, one independent state per prange iteration."""
+    for i in prange(velocity_mps.shape[0]):
+        frame = _flight_frame_kernel(velocity_mps[i], altitude_m[i], angle_of_attack_deg[i],
+                                     flap_angle_deg[i], bank_angle_deg[i], thrust_newtons[i],
+                                     target_altitude_m[i], proportional_gain)
+        out_lift_coefficient[i] = frame.lift_coefficient
+        out_lift[i] = frame.lift_newtons
+        out_drag_coefficient[i] = frame.drag_coefficient
+        out_drag[i] = frame.drag_newtons
+        out_stall_speed_in_turn[i] = frame.stall_speed_in_turn_mps
+        out_load_factor[i] = frame.load_factor
+        out_turn_radius[i] = frame.turn_radius_m
+        out_takeoff_status[i] = frame.takeoff_status
+        out_landing_status[i] = frame.landing_status
+        out_inflight_mode[i] = frame.inflight_mode
+        out_stall[i] = frame.stall
+        out_altitude_hold_command[i] = frame.altitude_hold_command
+        out_climb_rate[i] = frame.commanded_climb_rate_mps
+
+
+def run_all_algorithms_parallel(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg,
+                                bank_angle_deg, thrust_newtons, target_altitude_m,
+                                proportional_gain: float = 0.4) -> dict:
+    """
+    Multi-threaded variant of run_all_algorithms_batch for large sweeps.
+    Same inputs and same returned dict; each state runs through
+    compute_flight_frame on its own prange iteration (no GIL).
+    """
+    inputs = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (velocity_mps, altitude_m, angle_of_attack_deg,
+                                                     flap_angle_deg, bank_angle_deg, thrust_newtons,
+                                                     target_altitude_m)))
+    shape = inputs[0].shape
+    flat = [np.ascontiguousarray(x).ravel() for x in inputs]
+    count = flat[0].shape[0]
+
+    float_keys = ("lift_coefficient", "lift_newtons", "drag_coefficient", "drag_newtons",
+                  "stall_speed_in_turn_mps", "load_factor", "turn_radius_m")
+    status_keys = ("takeoff_status", "landing_status", "inflight_mode")
+    result = {key: np.empty(count, dtype=np.float64) for key in float_keys}
+    result.update({key: np.empty(count, dtype=np.int8) for key in status_keys})
+    result["stall"] = np.empty(count, dtype=np.bool_)
+    result["altitude_hold_command"] = np.empty(count, dtype=np.int8)
+    result["commanded_climb_rate_mps"] = np.empty(count, dtype=np.float64)
+
+    _batch_core(*flat, float(proportional_gain),
+                result["lift_coefficient"], result["lift_newtons"], result["drag_coefficient"],
+                result["drag_newtons"], result["stall_speed_in_turn_mps"], result["load_factor"],
+                result["turn_radius_m"], result["takeoff_status"], result["landing_status"],
+                result["inflight_mode"], result["stall"], result["altitude_hold_command"],
+                result["commanded_climb_rate_mps"])
+
+    result["weight_newtons"] = np.full(count, WEIGHT_N)
+    return {key: array.reshape(shape) for key, array in result.items()}
+
+
+# ----- optional ahead-of-time build (python build_physics.py) -----
+
+def _source_fingerprint() -> int:
+    """Return a 60-bit hash of this file; the AOT build bakes it in to detect stale extensions."""
+    with open(__file__, "rb") as source:
+        return int(hashlib.sha256(source.read()).hexdigest()[:15], 16)
+
+
+_aot = None
+if os.environ.get("FLARE_DISABLE_AOT") != "1":
+    try:
+        import flight_physics_compiled as _aot
+    except ImportError:
+        pass
+
+if _aot is not None and getattr(_aot, "source_fingerprint", lambda: None)() != _source_fingerprint():
+    # constants are frozen into the extension, so any edit to this file makes it stale
+    warnings.warn("flight_physics_compiled was built from a different flight_physics.py; "
+                  "ignoring it and using the JIT (re-run build_physics.py to refresh it)",
+                  RuntimeWarning, stacklevel=2)
+    _aot = None
+
+if _aot is not None:
+    # only Python-level call sites are rebound; jitted kernels keep their own references
+    _takeoff_core = _aot.takeoff_core
+    _landing_core = _aot.landing_core
+    _stall_core = _aot.stall_core
+    _inflight_core = _aot.inflight_core
+    _turn_core = _aot.turn_core
+    _altitude_hold_core = _aot.altitude_hold_core
+
+    def compute_flight_frame(velocity_mps: float, altitude_m: float, angle_of_attack_deg: float,
+                             flap_angle_deg: float, bank_angle_deg: float, thrust_newtons: float,
+                             target_altitude_m: float, proportional_gain: float = 0.4) -> FlightFrame:
+        """AOT-compiled compute_flight_frame (same arguments and FlightFrame result)."""
+        return FlightFrame(*_aot.flight_frame(velocity_mps, altitude_m, angle_of_attack_deg, flap_angle_deg,
+                                              bank_angle_deg, thrust_newtons, target_altitude_m,
+                                              proportional_gain))
+
+
+# ----- JIT warm-up -----
+
+def _warm_up() -> None:
+    """
+    Call every scalar jitted function once so the first GUI tick (or direct
+    helper call) doesn't pay for compilation. _batch_core is left to compile
+    lazily, since only batch callers need it.
+    """
+    calculate_weight()
+    calculate_stall_speed_for_clean_configuration()
+    calculate_drag(50.0, calculate_drag_coefficient(calculate_lift(50.0, calculate_lift_coefficient(2.0, 0.0))))
+    calculate_turn_radius(50.0, 10.0)
+    calculate_load_factor(10.0)
+    _takeoff_core(50.0, 0.0, 2.0, 0.0)
+    _landing_core(50.0, 100.0, 10000.0, 2.0, 0.0)
+    _stall_core(50.0, 2.0, 10.0, 0.0)
+    _inflight_core(50.0, 500.0, 2.0, 0.0, 2000.0)
+    _turn_core(50.0, 10.0)
+    _altitude_hold_core(500.0, 2000.0, 0.4)
+    compute_flight_frame(50.0, 500.0, 2.0, 0.0, 10.0, 10000.0, 2000.0)
+
+
+if _aot is None:
+    _warm_up()
@@ -0,0 +1,46 @@
+# test_flight_history.py
+"""
+Ring-buffer checks for flight_history.HistoryBuffer: oldest-first series and
+window stats before and after the buffer wraps.
+"""
+
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+from flight_history import HistoryBuffer
+
+
+def _filled(size, count):
+    buffer = HistoryBuffer(("x",), size=size)
+    for value in range(count):
+        buffer.append(SimpleNamespace(x=float(value)))
+    return buffer
+
+
+def test_series_before_wrap():
+    np.testing.assert_array_equal(_filled(3, 0).series("x"), [])
+    np.testing.assert_array_equal(_filled(3, 2).series("x"), [0.0, 1.0])
+    np.testing.assert_array_equal(_filled(3, 3).series("x"), [0.0, 1.0, 2.0])
+
+
+def test_series_after_wrap_is_oldest_first():
+    np.testing.assert_array_equal(_filled(3, 5).series("x"), [2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(_filled(3, 6).series("x"), [3.0, 4.0, 5.0])
+
+
+def test_stats_empty_is_nan():
+    assert all(math.isnan(value) for value in _filled(3, 0).stats("x"))
+
+
+def test_stats_before_and_after_wrap():
+    assert _filled(3, 2).stats("x") == (0.0, 1.0, 0.5)
+    assert _filled(3, 5).stats("x") == (2.0, 4.0, 3.0)
+
+
+def test_append_reads_each_field_from_first_record_that_has_it():
+    buffer = HistoryBuffer(("velocity_mps", "lift_newtons"), size=2)
+    buffer.append(SimpleNamespace(velocity_mps=50.0), SimpleNamespace(velocity_mps=0.0, lift_newtons=9000.0))
+    np.testing.assert_array_equal(buffer.series("velocity_mps"), [50.0])
+    np.testing.assert_array_equal(buffer.series("lift_newtons"), [9000.0])
@@ -0,0 +1,98 @@
+# test_flight_physics.py
+"""
+Consistency checks for flight_physics: the six algorithm wrappers, the fused
+compute_flight_frame kernel and both batch entry points implement the same
+rules separately, so they must agree state for state.
+"""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+import flight_physics as fp
+
+FLOAT_FIELDS = ("lift_coefficient", "lift_newtons", "drag_coefficient", "drag_newtons",
+                "weight_newtons", "stall_speed_in_turn_mps", "load_factor", "turn_radius_m",
+                "commanded_climb_rate_mps")
+CODE_FIELDS = ("takeoff_status", "landing_status", "inflight_mode", "stall", "altitude_hold_command")
+
+
+def _states():
+    """Threshold-straddling grid (0.1 / 10 m, 16.7 / 55 m/s, 200 m, 15 deg, ~0 bank) plus random states."""
+    def around(*thresholds):
+        # each threshold plus a value just either side, so moving it in any one copy shows up
+        return [t + d for t in thresholds for d in (-1e-6, 0.0, 1e-6)]
+
+    grid = itertools.product(
+        [0.0, 10.0, 40.0, 80.0] + around(16.7, 55.0),                 # velocity
+        [0.0, 0.2, 1000.0] + around(0.1, 10.0, 200.0, 1995.0, 1998.0, 2002.0, 2005.0),  # altitude
+        [-5.0, 2.0] + around(15.0),                                     # angle of attack
+        [0.0, 10.0],                                                    # flaps
+        [-20.0, 0.0, 30.0] + around(1e-6, -1e-6),                       # bank
+        [0.0, 12000.0],                                              # thrust
+        [2000.0],                                                    # target altitude
+    )
+    rng = np.random.default_rng(1234)
+    n = 2000
+    random_states = zip(rng.uniform(0, 90, n), rng.uniform(0, 2500, n), rng.uniform(-5, 16, n),
+                        rng.choice([0.0, 10.0], n), rng.uniform(-45, 45, n), rng.uniform(0, 20000, n),
+                        rng.uniform(0, 2500, n))
+    return [tuple(float(x) for x in state) for state in itertools.chain(grid, random_states)]
+
+
+STATES = _states()
+
+
+def _close(a, b):
+    if math.isinf(a) or math.isinf(b):
+        return a == b
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_wrappers_match_compute_flight_frame():
+    for v, alt, aoa, flaps, bank, thrust, target_alt in STATES:
+        frame = fp.compute_flight_frame(v, alt, aoa, flaps, bank, thrust, target_alt)
+        takeoff = fp.takeoff_algorithm(v, alt, aoa, flaps)
+        landing = fp.landing_algorithm(v, alt, thrust, aoa, flaps)
+        stall = fp.stall_algorithm(v, aoa, bank, flaps)
+        inflight = fp.inflight_algorithm(v, alt, aoa, flaps, target_alt, thrust)
+        turn = fp.turn_algorithm(v, bank)
+        hold = fp.altitude_hold_algorithm(alt, target_alt)
+
+        assert takeoff.status == fp.TAKEOFF_STATUS[frame.takeoff_status]
+        assert landing.status == fp.LANDING_STATUS[frame.landing_status]
+        assert stall.stall == frame.stall
+        assert inflight.mode == fp.INFLIGHT_MODES[frame.inflight_mode]
+        assert hold.command == fp.ALTITUDE_HOLD_COMMANDS[frame.altitude_hold_command]
+
+        assert _close(takeoff.lift_newtons, frame.lift_newtons)
+        assert _close(takeoff.lift_coefficient, frame.lift_coefficient)
+        assert _close(takeoff.weight_newtons, frame.weight_newtons)
+        assert _close(landing.drag_newtons, frame.drag_newtons)
+        assert _close(stall.stall_speed_in_turn_mps, frame.stall_speed_in_turn_mps)
+        assert _close(turn.turn_radius_m, frame.turn_radius_m)
+        assert _close(turn.load_factor, frame.load_factor)
+        assert _close(hold.commanded_climb_rate_mps, frame.commanded_climb_rate_mps)
+
+
+@pytest.mark.parametrize("batch", [fp.run_all_algorithms_batch, fp.run_all_algorithms_parallel])
+def test_batch_matches_compute_flight_frame(batch):
+    columns = [np.array(column) for column in zip(*STATES)]
+    result = batch(*columns)
+    for i, state in enumerate(STATES):
+        frame = fp.compute_flight_frame(*state)
+        for name in CODE_FIELDS:
+            assert result[name][i] == getattr(frame, name), (name, state)
+        for name in FLOAT_FIELDS:
+            assert _close(float(result[name][i]), getattr(frame, name)), (name, state)
+
+
+@pytest.mark.parametrize("batch", [fp.run_all_algorithms_batch, fp.run_all_algorithms_parallel])
+@pytest.mark.parametrize("shape", [(), (0,), (2, 3)])
+def test_batch_keeps_input_shape(batch, shape):
+    result = batch(np.full(shape, 50.0), np.full(shape, 500.0), 2.0, 0.0, 10.0, 10000.0, 2000.0)
+    assert set(result) == set(FLOAT_FIELDS + CODE_FIELDS)
+    for name, array in result.items():
+        assert np.shape(array) == shape, name